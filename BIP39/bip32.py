@@ -0,0 +1,96 @@
+import hashlib
+import hmac
+import os
+
+from coincurve import PublicKey
+
+BIP32_HARDEN = 0x80000000
+# Order of the secp256k1 group
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+# A Bitcoin branch (one hardened and two non-hardened steps) takes ~53 us, while
+# starting a pool takes ~8 ms with fork and ~150 ms with spawn (macOS, Windows),
+# so below this many branches worker processes cost more than they save
+PARALLEL_MIN_BRANCHES = 8192
+
+# BIP32 Keys
+# A node is a (private_key, chain_code) tuple of 32-byte strings.
+# HMAC-SHA512 runs in OpenSSL and the EC multiplication in libsecp256k1.
+def master_key_from_seed(seed):
+    I = hmac.new(b'Bitcoin seed', seed, hashlib.sha512).digest()
+
+    master_key = int.from_bytes(I[:32], 'big')
+    if master_key == 0 or master_key >= SECP256K1_N:
+        raise ValueError("Invalid master key, use a different seed")
+    return I[:32], I[32:]
+
+def public_key(private_key, compressed=True):
+    return PublicKey.from_secret(private_key).format(compressed=compressed)
+
+def ckd_priv(node, index):
+    return ckd_priv_batch(node, (index,))[0]
+
+def ckd_priv_batch(node, indices):
+    # Derive sibling children in one pass: the HMAC key schedule (keyed by the
+    # parent chain code) and the parent serialization are computed once
+    private_key, chain_code = node
+    parent_key = int.from_bytes(private_key, 'big')
+    parent_mac = hmac.new(chain_code, digestmod=hashlib.sha512)
+    hardened_data = b'\x00' + private_key
+    normal_data = None
+
+    children = []
+    for index in indices:
+        if index & BIP32_HARDEN:
+            data = hardened_data
+        else:
+            if normal_data is None:
+                normal_data = public_key(private_key)
+            data = normal_data
+        mac = parent_mac.copy()
+        mac.update(data + index.to_bytes(4, 'big'))
+        I = mac.digest()
+
+        tweak = int.from_bytes(I[:32], 'big')
+        child_key = (tweak + parent_key) % SECP256K1_N
+        if tweak >= SECP256K1_N or child_key == 0:
+            raise ValueError(f"Invalid child key at index {index}, use the next index")
+        children.append((child_key.to_bytes(32, 'big'), I[32:]))
+
+    return children
+
+def derive_path(node, indices):
+    for index in indices:
+        node = ckd_priv(node, index)
+    return node
+
+def _derive_branches(parent, indices, suffix):
+    # Fork at the varying index, then apply each remaining step to every
+    # branch before moving on to the next step
+    nodes = ckd_priv_batch(parent, indices)
+    for index in suffix:
+        nodes = [ckd_priv(branch, index) for branch in nodes]
+    return nodes
+
+def available_cpus():
+    # Honour CPU affinity and cpuset limits where the platform exposes them
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def derive_batch(node, prefix, indices, suffix=(), workers=1):
+    # The shared prefix is walked once. Branches are derived serially unless the
+    # caller asks for more workers, each of which receives a copy of the parent
+    # private key; callers doing so need an if __name__ == "__main__" guard
+    parent = derive_path(node, prefix)
+    indices = list(indices)
+    workers = min(workers, available_cpus())
+    if workers <= 1 or len(indices) < PARALLEL_MIN_BRANCHES:
+        return _derive_branches(parent, indices, suffix)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = -(-len(indices) // workers)
+    chunks = [indices[i:i + chunk_size] for i in range(0, len(indices), chunk_size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = executor.map(_derive_branches, [parent] * len(chunks), chunks, [suffix] * len(chunks))
+        return [branch for chunk in results for branch in chunk]
@@ -1,28 +1,61 @@
-from bip32utils import BIP32Key
-from bip32utils import BIP32_HARDEN
+import hashlib
 
-def derive_bitcoin_keys(mnemonic, account_count=10):
+from base58 import b58encode_check
+from mnemonic import Mnemonic
+
+from bip32 import BIP32_HARDEN, derive_batch, master_key_from_seed, public_key
+
+# m / 44' / 0', shared by every account
+BTC_PREFIX = (44 + BIP32_HARDEN, 0 + BIP32_HARDEN)
+# change=0, address_index=0 below each account'
+BTC_SUFFIX = (0, 0)
+
+# OpenSSL 3.0.0-3.0.6 only ships RIPEMD-160 in its legacy provider
+try:
+    hashlib.new('ripemd160')
+
+    def ripemd160(data):
+        return hashlib.new('ripemd160', data).digest()
+except ValueError:
+    from Crypto.Hash import RIPEMD160
+
+    def ripemd160(data):
+        return RIPEMD160.new(data).digest()
+
+def hash160(data):
+    return ripemd160(hashlib.sha256(data).digest())
+
+def wif(private_key, compressed=True):
+    # 0x80 || key || 0x01 (compressed), followed by the first 4 bytes of SHA256(SHA256(...))
+    payload = b'\x80' + private_key + (b'\x01' if compressed else b'')
+    return b58encode_check(payload).decode()
+
+def derive_bitcoin_keys(mnemonic, account_count=10, workers=1):
     seed = Mnemonic.to_seed(mnemonic)
-    master_key = BIP32Key.fromEntropy(seed)
+    master_key = master_key_from_seed(seed)
     keys = []
 
-    for account in range(account_count):
-        # Derive the path for the account using BIP44
-        # m / purpose' / coin_type' / account' / change / address_index
-        # For Bitcoin, coin_type is 0 and we use the external chain (change=0)
-        account_key = master_key.ChildKey(44 + BIP32_HARDEN) \
-                                 .ChildKey(0 + BIP32_HARDEN) \
-                                 .ChildKey(account + BIP32_HARDEN)
-        
-        # Derive the first address key pair (change=0, address_index=0)
-        address_key = account_key.ChildKey(0).ChildKey(0)
+    # Derive the path for the account using BIP44
+    # m / purpose' / coin_type' / account' / change / address_index
+    # For Bitcoin, coin_type is 0 and we use the external chain (change=0)
+    # m / 44' / 0' is shared by every account, so it is derived only once,
+    # then every account takes the first address key pair (change=0, address_index=0)
+    address_keys = derive_batch(
+        master_key,
+        BTC_PREFIX,
+        [account + BIP32_HARDEN for account in range(account_count)],
+        suffix=BTC_SUFFIX,
+        workers=workers,
+    )
+
+    for account, (private_key, _) in enumerate(address_keys):
+        address_public_key = public_key(private_key)
         
         keys.append({
             'account': account,
-            'address': address_key.Address(),
-            'public_key': address_key.PublicKey().hex(),
-            'private_key': address_key.WalletImportFormat(),
+            'address': b58encode_check(b'\x00' + hash160(address_public_key)).decode(),
+            'public_key': address_public_key.hex(),
+            'private_key': wif(private_key),
         })
 
     return keys
-
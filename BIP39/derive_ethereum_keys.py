@@ -1,28 +1,76 @@
-from eth_account import Account
-from eth_utils import to_checksum_address
-from eth_keys import keys
+from dataclasses import dataclass, field
 
-# Enable unaudited HD Wallet features
-Account.enable_unaudited_hdwallet_features()
+from mnemonic import Mnemonic
+
+from bip32 import BIP32_HARDEN, derive_batch, master_key_from_seed, public_key
+
+# m / 44' / 60' / 0' / 0, shared by every account
+ETH_PREFIX = (44 + BIP32_HARDEN, 60 + BIP32_HARDEN, 0 + BIP32_HARDEN, 0)
+
+def _keccak(data):
+    # eth_utils and its eth_hash keccak backend are only imported on first use
+    from eth_utils import keccak
+    return keccak(data)
+
+def checksum_address(address):
+    # EIP-55: upper-case every hex letter whose nibble in keccak(hex address) is >= 8
+    address_hex = address.hex()
+    address_hash = _keccak(address_hex.encode()).hex()
+    return '0x' + ''.join(
+        char.upper() if int(nibble, 16) >= 8 else char
+        for char, nibble in zip(address_hex, address_hash)
+    )
+
+# Raw key material, one entry per account; rendered to strings only on demand
+@dataclass
+class EthereumKeys:
+    addresses: list = field(default_factory=list)
+    public_keys: list = field(default_factory=list)
+    private_keys: list = field(default_factory=list, repr=False)
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def __getitem__(self, index):
+        # Index like the list of dicts this used to be, including negative indexes and slices
+        indices = range(len(self))[index]
+        if isinstance(index, slice):
+            return [self.render(i) for i in indices]
+        return self.render(indices)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.render(index)
+
+    def render(self, index):
+        return {
+            'account': index,
+            'address': checksum_address(self.addresses[index]),
+            'public_key': '0x' + self.public_keys[index].hex(),
+            'private_key': '0x' + self.private_keys[index].hex(),
+        }
 
 # Ethereum Keys
-def derive_ethereum_keys(mnemonic, account_count=10):
-    keys_list = []
-
-    for account in range(account_count):
-        # Derive private key using the seed and account number
-        acct = Account.from_mnemonic(mnemonic, account_path=f"m/44'/60'/0'/0/{account}")
-        private_key = acct.key
-        public_key = keys.PrivateKey(private_key).public_key
-
-        keys_list.append({
-            'account': account,
-            'address': to_checksum_address(acct.address),
-            'public_key': public_key.to_hex(),
-            'private_key': private_key.hex(),
-        })
-
-    return keys_list
+def derive_ethereum_keys(mnemonic, account_count=10, workers=1):
+    keys = EthereumKeys()
+
+    # Run the PBKDF2 seed stretching once and share it across all accounts
+    seed = Mnemonic.to_seed(mnemonic)
+    master_key = master_key_from_seed(seed)
+
+    # m / 44' / 60' / 0' / 0 is common to every account, only the address_index varies
+    # Derive private keys for m/44'/60'/0'/0/{account}
+    account_keys = derive_batch(master_key, ETH_PREFIX, range(account_count), workers=workers)
+
+    for private_key, _ in account_keys:
+        # Uncompressed public key without the 0x04 prefix
+        account_public_key = public_key(private_key, compressed=False)[1:]
+
+        keys.addresses.append(_keccak(account_public_key)[-20:])
+        keys.public_keys.append(account_public_key)
+        keys.private_keys.append(private_key)
+
+    return keys
 
 if __name__ == "__main__":
     # Example mnemonic for demonstration purposes
@@ -1,11 +1,17 @@
+from functools import lru_cache
+
 from mnemonic import Mnemonic
 
+# Choose the language for the mnemonic
+LANGUAGE = 'english'
+
+# Create the Mnemonic object on first use and reuse it, so the wordlist is read once
+@lru_cache(maxsize=None)
+def _mnemo():
+  return Mnemonic(LANGUAGE)
+
 def generate_mnemonic(strength):
-  # Choose the language for the mnemonic
-  language = 'english'
-  # Create a Mnemonic object
-  mnemo = Mnemonic(language)
-  return mnemo.generate(strength=strength)
+  return _mnemo().generate(strength=strength)
 
 def main():
   # Generate a 24-word mnemonic (256 bits of entropy)